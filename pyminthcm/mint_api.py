@@ -1,17 +1,192 @@
-import atexit
-import json
+import asyncio
+import copy
 import logging
+import os
+import re
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from json.decoder import JSONDecodeError
-from urllib.parse import quote
+from functools import lru_cache
+from urllib.parse import quote, urlsplit
 
+import httpx
+import orjson
 from oauthlib.oauth2 import (
     BackendApplicationClient,
     InvalidClientError,
     TokenExpiredError,
 )
 from oauthlib.oauth2.rfc6749.errors import CustomOAuth2Error
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ChunkedEncodingError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ContentDecodingError
+from requests.exceptions import SSLError as RequestsSSLError
 from requests_oauthlib import OAuth2Session
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError
+from urllib3.util.retry import Retry
+
+# Matches urls made only of characters that quote(url, safe="/:?=&") leaves untouched
+_SAFE_URL_RE = re.compile(r"[A-Za-z0-9_.\-~/:?=&]*")
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Strips trailing slashes and percent-encodes the url, skipping the encoding when it would be a no-op.
+
+    :param url: (string) The url to normalize.
+
+    :return: (string) The normalized url.
+    """
+    url = url.rstrip("/")
+    if _SAFE_URL_RE.fullmatch(url):
+        return url
+    return quote(url, safe="/:?=&")
+
+
+def _read_body(response: Response) -> bytes:
+    """
+    Reads the whole body of a streamed response in one call.
+    Read errors are raised as the same requests exceptions response.content would raise,
+    and the response is closed on those paths.
+
+    :param response: (Response) A response sent with stream=True.
+
+    :return: (bytes) The decoded response body.
+    """
+    try:
+        return response.raw.read(decode_content=True)
+    except ProtocolError as e:
+        response.close()
+        raise ChunkedEncodingError(e) from e
+    except DecodeError as e:
+        response.close()
+        raise ContentDecodingError(e) from e
+    except ReadTimeoutError as e:
+        response.close()
+        raise RequestsConnectionError(e) from e
+    except SSLError as e:
+        response.close()
+        raise RequestsSSLError(e) from e
+
+
+def _parse_response(status_code: int, content: bytes) -> dict:
+    """
+    Decodes an API response body, raising RequestError for error statuses and invalid JSON.
+
+    :param status_code: (int) The HTTP status code of the response.
+    :param content: (bytes) The raw response body.
+
+    :return: (dictionary) The response data.
+    """
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        logging.error(f"Failed to decode JSON response: {content}")
+        raise RequestError(
+            "request failed",
+            code=status_code,
+            details="Invalid JSON response: " + content.decode(),
+        )
+
+    if status_code >= 400:
+        error_details = data.get("errors", {}).get("detail", "")
+        raise RequestError(
+            "request failed",
+            code=status_code,
+            details=error_details,
+        )
+
+    return data
+
+
+def _logout_session(
+    session: OAuth2Session,
+    baseurl: str,
+    token_url: str,
+    client_id: str,
+    client_secret: str,
+    token_path: str | None,
+) -> None:
+    """
+    Logs out an Oauth2 Session and clears the saved token.
+    Sends the same request as MintHCM._request would, fetching a new token and retrying once if the token is rejected.
+    This is a module-level function, so that the finalizer registered for a MintHCM client does not keep it alive.
+
+    :param session: (OAuth2Session) The session to log out.
+    :param baseurl: (str) The base URL for the MintHCM API.
+    :param token_url: (str) The url to fetch a new access token from.
+    :param client_id: (str) The client ID for OAuth2 authentication.
+    :param client_secret: (str) The client secret for OAuth2 authentication.
+    :param token_path: (str) The path to the file where the access token is stored.
+
+    :return: None
+    """
+    for attempt in range(2):
+        try:
+            # a copy, as OAuth2Session adds the Authorization header to it in place
+            response = session.post(
+                f"{baseurl}/logout", data=_EMPTY_DATA, headers=dict(_BODY_HEADERS)
+            )
+        except TokenExpiredError:
+            if attempt == 1:
+                raise AuthenticationError("API token refresh failed")
+        else:
+            if response.status_code != 401:
+                break
+            if attempt == 1:
+                raise AuthenticationError(
+                    "authentication failed - token rejected",
+                    code=401,
+                )
+
+        session.fetch_token(
+            token_url=token_url, client_id=client_id, client_secret=client_secret
+        )
+
+    _parse_response(response.status_code, response.content)
+
+    if token_path:
+        try:
+            with open(token_path, "w+") as file:
+                file.write("")
+        except Exception:
+            pass
+
+
+# Filter operators accepted by Module.get, mapped to their API names
+_OPERATORS = {
+    "=": "EQ",
+    "<>": "NEQ",
+    ">": "GT",
+    ">=": "GTE",
+    "<": "LT",
+    "<=": "LTE",
+    "LIKE": "LIKE",
+    "NOT LIKE": "NOT_LIKE",
+    "IN": "IN",
+    "NOT IN": "NOT_IN",
+}
+
+
+@lru_cache(maxsize=1024)
+def _filter_prefix(field: str, operator: str) -> str:
+    """
+    Builds the "filter[field][OPERATOR]=" prefix of a filter parameter.
+    Cached, so that repeated queries with the same filters only have to append the values.
+
+    :param field: (string) The field to filter on.
+    :param operator: (string) The filter operator, one of the keys of _OPERATORS.
+
+    :return: (string) The filter parameter prefix.
+    """
+    try:
+        return f"filter[{field}][{_OPERATORS[operator]}]="
+    except KeyError:
+        raise RequestError(f"invalid filter operator: {operator!r}")
 
 
 class HTTPMethod(str, Enum):
@@ -21,6 +196,13 @@ class HTTPMethod(str, Enum):
     DELETE = "delete"
 
 
+# Methods that carry a JSON request body, and the headers sent along with it
+_BODY_METHODS = frozenset({HTTPMethod.POST, HTTPMethod.PATCH})
+_BODY_HEADERS = {"Content-Type": "application/json"}
+# Serialized body of a POST/PATCH request without payload, ie. logout
+_EMPTY_DATA = b'{"data":null}'
+
+
 class MintHCMError(Exception):
     """Custom exception for MintHCM API errors."""
 
@@ -49,6 +231,23 @@ class RequestError(MintHCMError):
     pass
 
 
+class PreparedRequest:
+    """
+    A fully built API request that has not been sent yet, to be submitted with MintHCM.submit_batch.
+
+    :param method: (HTTPMethod) The HTTP method to use.
+    :param url: (str) The url to make the request to.
+    :param payload: (dict) The payload to send with the request.
+    """
+
+    __slots__ = ("method", "url", "payload")
+
+    def __init__(self, method: HTTPMethod, url: str, payload: dict | None = None):
+        self.method = method
+        self.url = url
+        self.payload = payload
+
+
 class MintHCM:
     """
     MintHCM API client for handling OAuth2 authentication and API requests.
@@ -57,11 +256,24 @@ class MintHCM:
 
     :param client_id: (str) The client ID for OAuth2 authentication.
     :param client_secret: (str) The client secret for OAuth2 authentication.
-    :param url: (str) The base URL for the MintHCM API.
+    :param url: (str) The base URL for the MintHCM API, ending with the API version segment
+        (e.g. "https://example.com/legacy/Api/V8"). The token endpoint is expected next to it
+        ("https://example.com/legacy/Api/access_token").
     :param token_path: (str) The path to the file where the access token will be stored.
-    :param logout_on_exit: (bool) If True, logs out the user when the instance is deleted.
+    :param logout_on_exit: (bool) If True, logs out the user when the instance is garbage collected
+        or the interpreter exits, whichever comes first.
     """
 
+    POOL_MAXSIZE = 32
+
+    _DEFAULT_HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/97.0.4692.99 Safari/537.36"
+        ),
+        "Accept-Encoding": "gzip, deflate",
+    }
+
     def __init__(
         self,
         client_id: str,
@@ -70,15 +282,22 @@ class MintHCM:
         token_path: str = "AccessToken.json",
         logout_on_exit: bool = False,
     ):
-        self.baseurl = url
+        # Kept unquoted, every request url built from it is quoted once in _request
+        self.baseurl = url.rstrip("/")
+        if not urlsplit(self.baseurl).path.strip("/"):
+            raise RequestError(f"invalid API url, missing version segment: {url}")
+        self._token_url = f"{self.baseurl.rsplit('/', 1)[0]}/access_token"
         self._client_id = client_id
         self._client_secret = client_secret
         self._token_path = token_path
         self._logout_on_exit = logout_on_exit
-        self._user_agent = (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/97.0.4692.99 Safari/537.36"
-        )
+        self._oauth_client = BackendApplicationClient(client_id=client_id)
+        self._modules_metadata = None
+        self._fields_cache = {}
+        self._aclients = {}
+        self._last_saved_token = None
+        self._refresh_lock = threading.Lock()
+        self._finalizer = None
         self._login()
 
     def _load_token(self) -> bool:
@@ -93,45 +312,72 @@ class MintHCM:
             return False
 
         try:
-            with open(self._token_path, "r") as file:
-                if token_data := file.read().strip():
-                    self.session.token = json.loads(token_data)
+            with open(self._token_path, "rb") as file:
+                if token_data := file.read():
+                    self.session.token = orjson.loads(token_data)
+                    self._last_saved_token = dict(self.session.token)
                     return True
-        except (FileNotFoundError, json.JSONDecodeError):
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return False
 
     def _save_token(self) -> None:
         """
         Saves the current token to the specified token path.
-        If the token path is not set, this method does nothing.
+        If the token path is not set or the token did not change since the last save, this method does nothing.
+        The token is written and synced to a temporary file, which then atomically replaces the token file,
+        so a crash mid-write never leaves a truncated token behind.
 
         :return: None
         """
-        if not self._token_path:
+        if not self._token_path or self.session.token == self._last_saved_token:
             return
 
-        with open(self._token_path, "w") as file:
-            file.write(json.dumps(self.session.token))
-
-    def _refresh_token(self) -> None:
+        # A unique temp file in the target directory, so concurrent processes never share it
+        # and os.replace stays on one filesystem
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self._token_path))
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(orjson.dumps(self.session.token))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self._token_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._last_saved_token = dict(self.session.token)
+
+    def _refresh_token(self, rejected_token: str | None = None) -> None:
         """
         Fetch a new token from from token access url, specified in config file.
+        Concurrent callers are serialized. If the session no longer holds the rejected token,
+        another caller has already replaced it, so no new token is fetched.
+
+        :param rejected_token: (string) The access token the API rejected, if the refresh follows a failed request.
 
         :return: None
         """
-        try:
-            self.session.fetch_token(
-                token_url=f"{self.baseurl[:-2]}access_token",
-                client_id=self._client_id,
-                client_secret=self._client_secret,
-            )
-            self._save_token()
-        except InvalidClientError:
-            raise AuthenticationError("invalid API client ID or secret")
-        except CustomOAuth2Error:
-            raise RequestError("error accessing MintHCM API")
-        except Exception as e:
-            raise RequestError(f"failed to refresh token: {str(e)}")
+        with self._refresh_lock:
+            if (
+                rejected_token is not None
+                and self.session.access_token != rejected_token
+            ):
+                return
+
+            try:
+                self.session.fetch_token(
+                    token_url=self._token_url,
+                    client_id=self._client_id,
+                    client_secret=self._client_secret,
+                )
+                self._save_token()
+            except InvalidClientError:
+                raise AuthenticationError("invalid API client ID or secret")
+            except CustomOAuth2Error:
+                raise RequestError("error accessing MintHCM API")
+            except Exception as e:
+                raise RequestError(f"failed to refresh token: {str(e)}")
 
     def _login(self) -> None:
         """
@@ -141,11 +387,12 @@ class MintHCM:
         :return: None
         """
         if not hasattr(self, "OAuth2Session"):
-            client = BackendApplicationClient(client_id=self._client_id)
-            self.session = OAuth2Session(client=client, client_id=self._client_id)
-            self.session.headers.update(
-                {"User-Agent": self._user_agent, "Content-Type": "application/json"}
+            self.session = OAuth2Session(
+                client=self._oauth_client, client_id=self._client_id
             )
+            self._mount_adapter()
+            self._dispatch = {m: getattr(self.session, m.value) for m in HTTPMethod}
+            self.session.headers.update(MintHCM._DEFAULT_HEADERS)
             if self._token_path and self._load_token():
                 pass
             else:
@@ -153,23 +400,91 @@ class MintHCM:
         else:
             self._refresh_token()
 
-        if self._logout_on_exit:
-            atexit.register(self._logout)
+        if self._logout_on_exit and self._finalizer is None:
+            self._finalizer = weakref.finalize(
+                self, _logout_session, *self._logout_args()
+            )
+
+    def _mount_adapter(self) -> None:
+        """
+        Mounts a pooled HTTP adapter for the API host on the current session,
+        so that consecutive requests reuse the same keep-alive connections.
+
+        :return: None
+        """
+        parts = urlsplit(self.baseurl)
+        self.session.mount(
+            f"{parts.scheme}://{parts.netloc}",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.POOL_MAXSIZE,
+                max_retries=Retry(total=0),
+            ),
+        )
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        """
+        Builds a pooled HTTP/2 client for the asynchronous transport.
+        Like the requests session, it has no timeouts, so requests waiting for a pooled connection do not fail.
+
+        :return: (httpx.AsyncClient) The new client.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            headers=MintHCM._DEFAULT_HEADERS,
+            timeout=httpx.Timeout(None),
+            limits=httpx.Limits(
+                max_connections=64, max_keepalive_connections=self.POOL_MAXSIZE
+            ),
+        )
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """
+        Returns the asynchronous client of the running event loop, creating it on first use.
+        httpx clients are bound to the loop they were first used in, so each loop gets its own.
+
+        :return: (httpx.AsyncClient) The client for the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is None or client.is_closed:
+            # clients of closed loops can no longer be closed, only released
+            self._aclients = {
+                other_loop: other_client
+                for other_loop, other_client in self._aclients.items()
+                if not other_loop.is_closed()
+            }
+            client = self._aclients[loop] = self._new_async_client()
+        return client
 
     def _logout(self) -> None:
         """
-        Logs out current Oauth2 Session
+        Logs out current Oauth2 Session.
+        If logout_on_exit was set, this runs the registered finalizer, so the session is not logged out twice.
 
         :return: None
         """
-        self._request(f"{self.baseurl}/logout", "post")
+        if self._finalizer is not None:
+            self._finalizer()
+        else:
+            _logout_session(*self._logout_args())
 
-        if self._token_path:
-            try:
-                with open(self._token_path, "w+") as file:
-                    file.write("")
-            except Exception:
-                pass
+        self._last_saved_token = None
+
+    def _logout_args(self) -> tuple:
+        """
+        Collects the arguments of _logout_session for this client, without a reference to the client itself.
+
+        :return: (tuple) The arguments of _logout_session.
+        """
+        return (
+            self.session,
+            self.baseurl,
+            self._token_url,
+            self._client_id,
+            self._client_secret,
+            self._token_path,
+        )
 
     def _request(
         self, url: str, method: HTTPMethod, payload: dict | None = None
@@ -182,62 +497,166 @@ class MintHCM:
 
         :return: (dictionary) The response data.
         """
-        url = url.rstrip("/")
-        url = quote(url, safe="/:?=&")
+        url = _normalize_url(url)
 
-        try:
-            request_method = getattr(self.session, method)
-        except AttributeError:
+        request_method = self._dispatch.get(method)
+        if request_method is None:
             raise RequestError(f"invalid HTTP method: {method}")
 
-        data = json.dumps({"data": payload})
+        if method in _BODY_METHODS:
+            data = _EMPTY_DATA if payload is None else orjson.dumps({"data": payload})
+            body_headers = _BODY_HEADERS
+        else:
+            data = body_headers = None
 
+        # Only the send is retried; the url and body above are prepared once
         for attempt in range(2):
+            sent_token = self.session.access_token
+            # OAuth2Session adds the Authorization header to the given dict in place,
+            # so every send gets its own copy
+            headers = dict(body_headers) if body_headers else None
             try:
-                if method in [HTTPMethod.GET, HTTPMethod.DELETE]:
-                    response = request_method(url)
-                else:
-                    response = request_method(url, data=data)
-
-                status_code = response.status_code
-
-                if status_code == 401:
-                    if attempt == 0:
-                        self._refresh_token()
-                        continue
-                    else:
-                        raise AuthenticationError(
-                            "authentication failed - token rejected",
-                            code=401,
-                        )
-
-                if status_code >= 400:
-                    content = json.loads(response.content)
-                    error_details = content.get("errors", {}).get("detail", "")
-                    raise RequestError(
-                        "request failed",
-                        code=response.status_code,
-                        details=error_details,
-                    )
-
-                return json.loads(response.content)
+                response = request_method(url, data=data, headers=headers, stream=True)
             except TokenExpiredError:
-                if attempt == 0:
-                    self._refresh_token()
-                else:
+                if attempt == 1:
                     raise AuthenticationError("API token refresh failed")
-            except JSONDecodeError:
-                logging.error(f"Failed to decode JSON response: {response.content}")
-                raise RequestError(
-                    "request failed",
-                    code=status_code,
-                    details="Invalid JSON response: " + response.content.decode(),
+                self._refresh_token(sent_token)
+                continue
+
+            # Reading the raw body in one call avoids buffering it twice in
+            # response.content, and hands the connection back to the pool
+            content = _read_body(response)
+
+            if response.status_code != 401:
+                break
+
+            if attempt == 1:
+                raise AuthenticationError(
+                    "authentication failed - token rejected",
+                    code=401,
                 )
-            except Exception as e:
-                if attempt == 1 or not isinstance(e, TokenExpiredError):
-                    raise e
+            self._refresh_token(sent_token)
+
+        return _parse_response(response.status_code, content)
+
+    async def _arequest(
+        self,
+        url: str,
+        method: HTTPMethod,
+        payload: dict | None = None,
+    ) -> dict:
+        """
+        Asynchronous counterpart of _request, sent through the httpx.AsyncClient of the running event loop.
+        Independent calls can be awaited together, e.g. with asyncio.gather.
+        :param url: (string) The url to make the request to.
+        :param method: (string) The HTTP method to use (get, post, patch, delete).
+        :param payload: (dictionary) The payload to send with the request.
 
-        raise RequestError("request failed after retrying")
+        :return: (dictionary) The response data.
+        """
+        url = _normalize_url(url)
+
+        try:
+            method = HTTPMethod(method)
+        except ValueError:
+            raise RequestError(f"invalid HTTP method: {method}")
+
+        client = self._async_client()
+
+        if method in _BODY_METHODS:
+            data = _EMPTY_DATA if payload is None else orjson.dumps({"data": payload})
+            body_headers = _BODY_HEADERS
+        else:
+            data = None
+            body_headers = {}
+
+        for attempt in range(2):
+            sent_token = self.session.access_token
+            headers = {**body_headers, "Authorization": f"Bearer {sent_token}"}
+            response = await client.request(
+                method.value, url, headers=headers, content=data
+            )
+
+            if response.status_code != 401:
+                break
+
+            if attempt == 1:
+                raise AuthenticationError(
+                    "authentication failed - token rejected",
+                    code=401,
+                )
+            await asyncio.to_thread(self._refresh_token, sent_token)
+
+        return _parse_response(response.status_code, response.content)
+
+    async def asubmit_batch(self, requests: list[PreparedRequest]) -> list[dict]:
+        """
+        Sends independent prepared requests concurrently on the running event loop and waits for all of them.
+
+        :param requests: (list) The PreparedRequest objects to send, ie. built with Module.prepare_get.
+
+        :return: (list) The response data, in the order of the requests.
+        """
+        return await asyncio.gather(
+            *(
+                self._arequest(request.url, request.method, request.payload)
+                for request in requests
+            )
+        )
+
+    def submit_batch(self, requests: list[PreparedRequest]) -> list[dict]:
+        """
+        Sends independent prepared requests concurrently and waits for all of them.
+        The requests run in their own event loop, whose client is closed once they are done.
+        When called from a running event loop (ie. Jupyter), where a new loop cannot be started,
+        the requests are sent from a thread pool instead; use asubmit_batch to stay on that loop.
+
+        :param requests: (list) The PreparedRequest objects to send, ie. built with Module.prepare_get.
+
+        :return: (list) The response data, in the order of the requests.
+        """
+
+        async def send_all() -> list[dict]:
+            try:
+                return await self.asubmit_batch(requests)
+            finally:
+                await self.aclose()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(send_all())
+
+        if not requests:
+            return []
+
+        workers = min(len(requests), self.POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda request: self._request(
+                        request.url, request.method, request.payload
+                    ),
+                    requests,
+                )
+            )
+
+    async def aclose(self) -> None:
+        """
+        Closes the connections held by the asynchronous client of the running event loop.
+        MintHCM can also be used as an async context manager, which calls this on exit.
+
+        :return: None
+        """
+        client = self._aclients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> "MintHCM":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     def get(self, url: str) -> dict:
         """
@@ -281,13 +700,68 @@ class MintHCM:
         """
         return self._request(url, HTTPMethod.DELETE)
 
+    async def aget(self, url: str) -> dict:
+        """
+        Makes an asynchronous GET request to the given url.
+
+        :param url: (string) The url to make the request to.
+
+        :return: (dictionary) The response data.
+        """
+        return await self._arequest(url, HTTPMethod.GET)
+
+    async def apost(self, url: str, payload: dict) -> dict:
+        """
+        Makes an asynchronous POST request to the given url.
+
+        :param url: (string) The url to make the request to.
+        :param payload: (dictionary) The payload to send with the request.
+
+        :return: (dictionary) The response data.
+        """
+        return await self._arequest(url, HTTPMethod.POST, payload)
+
+    async def apatch(self, url: str, payload: dict) -> dict:
+        """
+        Makes an asynchronous PATCH request to the given url.
+
+        :param url: (string) The url to make the request to.
+        :param payload: (dictionary) The payload to send with the request.
+
+        :return: (dictionary) The response data.
+        """
+        return await self._arequest(url, HTTPMethod.PATCH, payload)
+
+    async def adelete(self, url: str) -> dict:
+        """
+        Makes an asynchronous DELETE request to the given url.
+
+        :param url: (string) The url to make the request to.
+
+        :return: (dictionary) The response data.
+        """
+        return await self._arequest(url, HTTPMethod.DELETE)
+
     def get_modules_metadata(self) -> dict:
         """
         Retrieves the metadata of all modules in the MintHCM instance.
+        The result is cached until invalidate_metadata is called; each call returns a copy,
+        so changing it does not affect the cache.
 
         :return: (dictionary) The metadata of all modules.
         """
-        return self.get(f"{self.baseurl}/meta/modules")
+        if self._modules_metadata is None:
+            self._modules_metadata = self.get(f"{self.baseurl}/meta/modules")
+        return copy.deepcopy(self._modules_metadata)
+
+    def invalidate_metadata(self) -> None:
+        """
+        Clears the cached modules metadata and module fields, e.g. after a schema change.
+
+        :return: None
+        """
+        self._modules_metadata = None
+        self._fields_cache.clear()
 
     def get_user_preferences(self, user_id: str) -> dict:
         """
@@ -304,6 +778,7 @@ class Module:
     def __init__(self, minthcm: MintHCM, module_name: str):
         self.module_name = module_name
         self.minthcm = minthcm
+        self._base = f"{minthcm.baseurl}/module/{module_name}"
 
     def create(self, attributes: dict) -> dict:
         """
@@ -337,17 +812,90 @@ class Module:
 
         :return: (dictionary) Confirmation of deletion of record.
         """
-        url = f"/module/{self.module_name}/{record_id}"
-        return self.minthcm.delete(f"{self.minthcm.baseurl}{url}")
+        return self.minthcm.delete(f"{self._base}/{record_id}")
 
     def fields(self) -> list:
         """
         Gets all the attributes that can be set in a record.
+        The result is cached on the MintHCM instance until MintHCM.invalidate_metadata is called;
+        each call returns a copy, so changing it does not affect the cache.
         :return: (list) All the names of attributes in a record.
         """
-        # Get total record count
-        url = f"/meta/fields/{self.module_name}"
-        return self.minthcm.get(f"{self.minthcm.baseurl}{url}")
+        fields_cache = self.minthcm._fields_cache
+        if self.module_name not in fields_cache:
+            url = f"/meta/fields/{self.module_name}"
+            fields_cache[self.module_name] = self.minthcm.get(
+                f"{self.minthcm.baseurl}{url}"
+            )
+        return copy.deepcopy(fields_cache[self.module_name])
+
+    def _query_url(
+        self, fields: list | None, sort: str | None, operator: str, filters: dict
+    ) -> str:
+        """
+        Builds the url of a get query, without the page parameters.
+
+        :param fields: (list) A list of fields you want to be returned from each record.
+        :param sort: (string) The field you want the records to be sorted by.
+        :param operator: (string) The operator to use for filtering. Can be "and" or "or".
+        :param filters: (dict) The filters to apply to the records, as in get.
+
+        :return: (string) The query url.
+        """
+        if operator not in ("and", "or"):
+            operator = "and"
+
+        query_parts = []
+
+        if fields:
+            query_parts.append(f"fields[{self.module_name}]=" + ",".join(fields))
+
+        query_parts.append(f"filter[operator]={operator}")
+
+        for field, value in filters.items():
+            if isinstance(value, dict):
+                if value["operator"] == "BETWEEN":
+                    values = value["value"].split(",")
+                    query_parts.append(_filter_prefix(field, ">") + values[0])
+                    query_parts.append(_filter_prefix(field, "<") + values[1])
+                else:
+                    query_parts.append(
+                        f"{_filter_prefix(field, value['operator'])}{value['value']}"
+                    )
+            else:
+                query_parts.append(f"{_filter_prefix(field, '=')}{value}")
+
+        if sort:
+            query_parts.append(f"sort=-{sort}")
+
+        return f"{self._base}?" + "&".join(query_parts)
+
+    def prepare_get(
+        self,
+        fields: list = None,
+        sort: str = None,
+        operator: str = "and",
+        page: int = 1,
+        items_per_page: int = 100,
+        **filters,
+    ) -> PreparedRequest:
+        """
+        Builds the request for a single page of get, without sending it.
+        Many prepared requests can then be sent at once with MintHCM.submit_batch.
+
+        :param fields: (list) A list of fields you want to be returned from each record.
+        :param sort: (string) The field you want the records to be sorted by.
+        :param operator: (string) The operator to use for filtering. Can be "and" or "or".
+        :param page: (int) The page number to get.
+        :param items_per_page: (int) The number of records per page.
+        :param filters: (**kwargs) The filters to apply to the records, as in get.
+
+        :return: (PreparedRequest) The request to submit.
+        """
+        url = self._query_url(fields, sort, operator, filters)
+        return PreparedRequest(
+            HTTPMethod.GET, f"{url}&page[number]={page}&page[size]={items_per_page}"
+        )
 
     def get(
         self,
@@ -380,45 +928,7 @@ class Module:
 
         :return: (list) A list of dictionaries, where each dictionary is a record.
         """
-        if fields:
-            fields_str = f"?fields[{self.module_name}]=" + ",".join(fields)
-        else:
-            fields_str = "?"
-
-        if operator not in ["and", "or"]:
-            operator = "and"
-
-        filter_str = f"filter[operator]={operator}"
-
-        operators = {
-            "=": "EQ",
-            "<>": "NEQ",
-            ">": "GT",
-            ">=": "GTE",
-            "<": "LT",
-            "<=": "LTE",
-            "LIKE": "LIKE",
-            "NOT LIKE": "NOT_LIKE",
-            "IN": "IN",
-            "NOT IN": "NOT_IN",
-        }
-
-        for field, value in filters.items():
-            if isinstance(value, dict):
-                if value["operator"] == "BETWEEN":
-                    values = value["value"].split(",")
-                    filter_str += f"&filter[{field}][GT]={values[0]}&filter[{field}][LT]={values[1]}"
-                else:
-                    filter_str += f"&filter[{field}][{operators[value['operator']]}]={value['value']}"
-            else:
-                filter_str += f"&filter[{field}][EQ]={value}"
-
-        url = (
-            f"{self.minthcm.baseurl}/module/{self.module_name}{fields_str}&{filter_str}"
-        )
-
-        if sort:
-            url += f"&sort=-{sort}"
+        url = self._query_url(fields, sort, operator, filters)
 
         result = self.minthcm.get(
             f"{url}&page[number]={start_page}&page[size]={items_per_page}"
@@ -448,6 +958,27 @@ class Module:
 
         return final_records
 
+    def get_many(self, record_ids: list, fields: list = None, workers: int = 8) -> list:
+        """
+        Gets many records by id, fetching them in parallel threads over the pooled session.
+
+        :param record_ids: (list) ids of the records you want to get.
+        :param fields: (list) A list of fields you want to be returned from each record.
+        :param workers: (int) The number of concurrent requests, at least 1 and capped at MintHCM.POOL_MAXSIZE.
+
+        :return: (list) The result of get for each id, in the order of record_ids.
+        """
+        if workers < 1:
+            raise RequestError(f"invalid number of workers: {workers}")
+
+        workers = min(workers, self.minthcm.POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda record_id: self.get(fields=fields, id=record_id), record_ids
+                )
+            )
+
     def get_all_records(self) -> dict:
         """
         Gets all the records in a module, handling pagination.
@@ -455,7 +986,7 @@ class Module:
         :param items_per_page: (int) Number of records per page (optional, defaults to 100)
         :return: (dict) A dictionary containing all the records in the module.
         """
-        base_url = f"{self.minthcm.baseurl}/module/{self.module_name}"
+        base_url = self._base
 
         start_page = 1
         items_per_page = 100
@@ -489,6 +1020,55 @@ class Module:
 
         return final_records
 
+    async def aget_all_records(self) -> dict:
+        """
+        Asynchronous counterpart of get_all_records. After the first page reveals the page count,
+        the remaining pages are requested concurrently, at most MintHCM.POOL_MAXSIZE at a time.
+
+        :return: (dict) A dictionary containing all the records in the module.
+        """
+        base_url = self._base
+
+        items_per_page = 100
+
+        first_url = f"{base_url}?page[number]=1&page[size]={items_per_page}"
+        result = await self.minthcm.aget(first_url)
+
+        number_of_pages = result.get("meta", {}).get("total-pages", 1)
+
+        limit = asyncio.Semaphore(self.minthcm.POOL_MAXSIZE)
+
+        async def get_page(page: int) -> dict:
+            async with limit:
+                return await self.minthcm.aget(
+                    f"{base_url}?page[number]={page}&page[size]={items_per_page}"
+                )
+
+        results = [result] + await asyncio.gather(
+            *(get_page(page) for page in range(2, number_of_pages + 1))
+        )
+
+        final_records = {"data": []}
+        for result in results:
+            data = result.get("data", [])
+            if not data:
+                break
+
+            final_records["data"].extend(data)
+
+        return final_records
+
+    def _rel_url(self, record_id: str, related_module_name: str) -> str:
+        """
+        Builds the url of the relationships between a record and another module.
+
+        :param record_id: (string) id of the current module record.
+        :param related_module_name: (string) the related module name, ie. Contacts.
+
+        :return: (string) The relationships url.
+        """
+        return f"{self._base}/{record_id}/relationships/{related_module_name.lower()}"
+
     def get_relationship(self, record_id: str, related_module_name: str) -> dict:
         """
         returns the relationship between this record and another module.
@@ -498,8 +1078,7 @@ class Module:
 
         :return: (dictionary) A list of relationships that this module's record contains with the related module.
         """
-        url = f"/module/{self.module_name}/{record_id}/relationships/{related_module_name.lower()}"
-        return self.minthcm.get(f"{self.minthcm.baseurl}{url}")
+        return self.minthcm.get(self._rel_url(record_id, related_module_name))
 
     def create_relationship(
         self, record_id: str, related_module_name: str, related_bean_id: str
@@ -514,9 +1093,71 @@ class Module:
 
         :return: (dictionary) A record that the relationship was created.
         """
-        url = f"/module/{self.module_name}/{record_id}/relationships/{related_module_name.lower()}"
+        # capitalize() also lowercases the rest of the name, ie. "HR_Candidates" is sent as "Hr_candidates"
         data = {"type": related_module_name.capitalize(), "id": related_bean_id}
-        return self.minthcm.post(f"{self.minthcm.baseurl}{url}", payload=data)
+        return self.minthcm.post(
+            self._rel_url(record_id, related_module_name), payload=data
+        )
+
+    def _relationship_requests(
+        self, record_id: str, related_module_name: str, related_bean_ids: list
+    ) -> list[PreparedRequest]:
+        """
+        Builds the requests creating relationships between a record and many records of another module.
+
+        :param record_id: (string) id of the current module record.
+        :param related_module_name: (string) the module name of the related records, ie. Contacts.
+        :param related_bean_ids: (list) ids of the records inside of the other module.
+
+        :return: (list) One PreparedRequest per related record.
+        """
+        url = self._rel_url(record_id, related_module_name)
+        related_type = related_module_name.capitalize()
+        return [
+            PreparedRequest(
+                HTTPMethod.POST, url, {"type": related_type, "id": related_bean_id}
+            )
+            for related_bean_id in related_bean_ids
+        ]
+
+    def create_relationships(
+        self, record_id: str, related_module_name: str, related_bean_ids: list
+    ) -> list:
+        """
+        Creates relationships between a record and many records of another module, sending the requests concurrently.
+        From a running event loop, use acreate_relationships instead.
+
+        :param record_id: (string) id of the current module record.
+        :param related_module_name: (string) the module name of the records you want to create relationships with,
+               ie. Contacts.
+        :param related_bean_ids: (list) ids of the records inside of the other module.
+
+        :return: (list) Records that the relationships were created, in the order of related_bean_ids.
+        """
+        return self.minthcm.submit_batch(
+            self._relationship_requests(
+                record_id, related_module_name, related_bean_ids
+            )
+        )
+
+    async def acreate_relationships(
+        self, record_id: str, related_module_name: str, related_bean_ids: list
+    ) -> list:
+        """
+        Asynchronous counterpart of create_relationships, sent concurrently on the running event loop.
+
+        :param record_id: (string) id of the current module record.
+        :param related_module_name: (string) the module name of the records you want to create relationships with,
+               ie. Contacts.
+        :param related_bean_ids: (list) ids of the records inside of the other module.
+
+        :return: (list) Records that the relationships were created, in the order of related_bean_ids.
+        """
+        return await self.minthcm.asubmit_batch(
+            self._relationship_requests(
+                record_id, related_module_name, related_bean_ids
+            )
+        )
 
     def delete_relationship(
         self, record_id: str, related_module_name: str, related_bean_id: str
@@ -531,5 +1172,5 @@ class Module:
 
         :return: (dictionary) A record that the relationship was deleted.
         """
-        url = f"/module/{self.module_name}/{record_id}/relationships/{related_module_name.lower()}/{related_bean_id}"
-        return self.minthcm.delete(f"{self.minthcm.baseurl}{url}")
+        url = f"{self._rel_url(record_id, related_module_name)}/{related_bean_id}"
+        return self.minthcm.delete(url)
@@ -0,0 +1,337 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+from oauthlib.oauth2 import BackendApplicationClient
+from requests_oauthlib import OAuth2Session
+
+from pyminthcm.mint_api import (
+    AuthenticationError,
+    HTTPMethod,
+    MintHCM,
+    Module,
+    RequestError,
+    _BODY_HEADERS,
+    _logout_session,
+)
+
+API_URL = "https://example.com/legacy/Api/V8"
+
+
+def make_client(token_path=None, access_token="old"):
+    """
+    Builds a MintHCM client without logging in, holding a session with the given access token.
+    """
+    with mock.patch.object(MintHCM, "_login"):
+        minthcm = MintHCM("client", "secret", API_URL, token_path=token_path)
+
+    minthcm.session = OAuth2Session(
+        client=BackendApplicationClient(client_id="client"),
+        token={"access_token": access_token, "token_type": "Bearer"},
+    )
+    return minthcm
+
+
+def replace_token(minthcm):
+    """
+    Returns a _refresh_token stand-in that swaps the session token for "new".
+    """
+
+    def refresh(rejected_token=None):
+        minthcm.session.token = {"access_token": "new", "token_type": "Bearer"}
+
+    return refresh
+
+
+class SaveTokenTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.token_path = os.path.join(self.tmpdir.name, "AccessToken.json")
+
+    def test_writes_token_file(self):
+        minthcm = make_client(token_path=self.token_path)
+        minthcm._save_token()
+
+        with open(self.token_path, "rb") as file:
+            self.assertIn(b'"access_token":"old"', file.read())
+        self.assertEqual(os.listdir(self.tmpdir.name), ["AccessToken.json"])
+
+    def test_skips_unchanged_token(self):
+        minthcm = make_client(token_path=self.token_path)
+
+        with mock.patch("pyminthcm.mint_api.os.replace", wraps=os.replace) as replace:
+            minthcm._save_token()
+            minthcm._save_token()
+            self.assertEqual(replace.call_count, 1)
+
+            minthcm.session.token = {"access_token": "new", "token_type": "Bearer"}
+            minthcm._save_token()
+            self.assertEqual(replace.call_count, 2)
+
+    def test_without_token_path(self):
+        minthcm = make_client(token_path=None)
+
+        with mock.patch("pyminthcm.mint_api.os.replace") as replace:
+            minthcm._save_token()
+        replace.assert_not_called()
+
+
+class MetadataCacheTest(unittest.TestCase):
+    def test_returns_copies_of_the_cache(self):
+        minthcm = make_client()
+        metadata = {"Users": {"fields": ["id", "name"]}}
+
+        with mock.patch.object(MintHCM, "get", return_value=metadata) as get:
+            first = minthcm.get_modules_metadata()
+            first["Users"]["fields"].append("changed")
+            second = minthcm.get_modules_metadata()
+
+        get.assert_called_once()
+        self.assertEqual(second, {"Users": {"fields": ["id", "name"]}})
+
+
+class QueryUrlTest(unittest.TestCase):
+    def setUp(self):
+        self.module = Module(make_client(), "Users")
+
+    def test_matches_baseline_format(self):
+        url = self.module._query_url(
+            ["id", "name"],
+            "date_entered",
+            "or",
+            {
+                "status": "Active",
+                "age": {"operator": ">=", "value": "18"},
+                "date_modified": {
+                    "operator": "BETWEEN",
+                    "value": "2024-01-01,2025-01-01",
+                },
+            },
+        )
+
+        self.assertEqual(
+            url,
+            f"{API_URL}/module/Users?fields[Users]=id,name&filter[operator]=or"
+            "&filter[status][EQ]=Active&filter[age][GTE]=18"
+            "&filter[date_modified][GT]=2024-01-01&filter[date_modified][LT]=2025-01-01"
+            "&sort=-date_entered",
+        )
+
+    def test_without_fields_and_with_invalid_operator(self):
+        url = self.module._query_url(None, None, "xor", {"name": "admin"})
+
+        self.assertEqual(
+            url,
+            f"{API_URL}/module/Users?filter[operator]=and&filter[name][EQ]=admin",
+        )
+
+    def test_prepare_get_appends_page(self):
+        request = self.module.prepare_get(page=3, items_per_page=50, name="admin")
+
+        self.assertEqual(
+            request.url,
+            f"{API_URL}/module/Users?filter[operator]=and&filter[name][EQ]=admin"
+            "&page[number]=3&page[size]=50",
+        )
+
+    def test_unknown_operator(self):
+        with self.assertRaises(RequestError) as context:
+            self.module._query_url(
+                None, None, "and", {"name": {"operator": "~", "value": "x"}}
+            )
+
+        self.assertIn("invalid filter operator: '~'", str(context.exception))
+
+
+class RequestRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.minthcm = make_client()
+        self.sent_tokens = []
+        self.statuses = [401, 200]
+
+    def send(self, url, data=None, headers=None, stream=False):
+        self.sent_tokens.append(self.minthcm.session.access_token)
+        response = mock.Mock(status_code=self.statuses.pop(0))
+        response.raw.read.return_value = b'{"data": {"id": "1"}}'
+        return response
+
+    def test_refreshes_and_retries_on_401(self):
+        self.minthcm._dispatch = {HTTPMethod.GET: self.send}
+
+        with mock.patch.object(
+            self.minthcm, "_refresh_token", side_effect=replace_token(self.minthcm)
+        ) as refresh:
+            result = self.minthcm.get(f"{API_URL}/module/Users/1")
+
+        refresh.assert_called_once_with("old")
+        self.assertEqual(self.sent_tokens, ["old", "new"])
+        self.assertEqual(result, {"data": {"id": "1"}})
+
+    def test_second_401_raises(self):
+        self.statuses = [401, 401]
+        self.minthcm._dispatch = {HTTPMethod.GET: self.send}
+
+        with mock.patch.object(
+            self.minthcm, "_refresh_token", side_effect=replace_token(self.minthcm)
+        ):
+            with self.assertRaises(AuthenticationError):
+                self.minthcm.get(f"{API_URL}/module/Users/1")
+
+
+class AsyncRequestRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.minthcm = make_client()
+        self.sent_tokens = []
+        self.statuses = [401, 200]
+
+    def handle(self, request):
+        self.sent_tokens.append(request.headers["Authorization"])
+        return httpx.Response(self.statuses.pop(0), json={"data": {"id": "1"}})
+
+    def new_async_client(self):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+    def aget(self, url):
+        async def send():
+            async with self.minthcm:
+                return await self.minthcm.aget(url)
+
+        return asyncio.run(send())
+
+    def test_refreshes_and_retries_on_401(self):
+        with mock.patch.object(
+            self.minthcm, "_new_async_client", side_effect=self.new_async_client
+        ), mock.patch.object(
+            self.minthcm, "_refresh_token", side_effect=replace_token(self.minthcm)
+        ) as refresh:
+            result = self.aget(f"{API_URL}/module/Users/1")
+
+        refresh.assert_called_once_with("old")
+        self.assertEqual(self.sent_tokens, ["Bearer old", "Bearer new"])
+        self.assertEqual(result, {"data": {"id": "1"}})
+
+    def test_second_401_raises(self):
+        self.statuses = [401, 401]
+
+        with mock.patch.object(
+            self.minthcm, "_new_async_client", side_effect=self.new_async_client
+        ), mock.patch.object(
+            self.minthcm, "_refresh_token", side_effect=replace_token(self.minthcm)
+        ):
+            with self.assertRaises(AuthenticationError):
+                self.aget(f"{API_URL}/module/Users/1")
+
+
+class AllRecordsTest(unittest.TestCase):
+    def setUp(self):
+        self.module = Module(make_client(), "Users")
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request):
+        page = int(request.url.params["page[number]"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return httpx.Response(
+            200, json={"meta": {"total-pages": 100}, "data": [{"id": str(page)}]}
+        )
+
+    def test_async_client_has_no_timeouts(self):
+        client = self.module.minthcm._new_async_client()
+        self.assertEqual(client.timeout, httpx.Timeout(None))
+
+    def test_limits_pages_in_flight(self):
+        async def get_all():
+            async with self.module.minthcm:
+                return await self.module.aget_all_records()
+
+        with mock.patch.object(
+            self.module.minthcm,
+            "_new_async_client",
+            side_effect=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(self.handle)
+            ),
+        ):
+            records = asyncio.run(get_all())
+
+        self.assertEqual(
+            [record["id"] for record in records["data"]],
+            [str(page) for page in range(1, 101)],
+        )
+        self.assertLessEqual(self.max_in_flight, MintHCM.POOL_MAXSIZE)
+
+
+class BodyHeadersTest(unittest.TestCase):
+    def setUp(self):
+        self.first = make_client(access_token="t1")
+        self.first._dispatch = {
+            method: getattr(self.first.session, method.value) for method in HTTPMethod
+        }
+        self.second = make_client(access_token="t2")
+        self.sent_headers = []
+
+    def send(self, request, **kwargs):
+        self.sent_headers.append(request.headers)
+        response = mock.Mock(status_code=200)
+        response.raw.read.return_value = b'{"data": {"id": "1"}}'
+        return response
+
+    def handle(self, request):
+        self.sent_headers.append(request.headers)
+        return httpx.Response(200, json={"data": {"id": "1"}})
+
+    def test_tokens_do_not_leak_between_clients(self):
+        with mock.patch.object(self.first.session, "send", side_effect=self.send):
+            self.first.post(f"{API_URL}/module", payload={"type": "Users"})
+            self.first.patch(f"{API_URL}/module", payload={"type": "Users"})
+
+        async def send():
+            async with self.second:
+                return await self.second.apost(
+                    f"{API_URL}/module", payload={"type": "Users"}
+                )
+
+        with mock.patch.object(
+            self.second,
+            "_new_async_client",
+            side_effect=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(self.handle)
+            ),
+        ):
+            asyncio.run(send())
+
+        self.assertEqual(
+            [headers["Authorization"] for headers in self.sent_headers],
+            ["Bearer t1", "Bearer t1", "Bearer t2"],
+        )
+        self.assertTrue(
+            all(
+                headers["Content-Type"] == "application/json"
+                for headers in self.sent_headers
+            )
+        )
+
+
+class LogoutTest(unittest.TestCase):
+    def test_sends_json_body_without_touching_shared_headers(self):
+        minthcm = make_client(access_token="t1")
+        response = mock.Mock(status_code=200, content=b"{}")
+
+        with mock.patch.object(minthcm.session, "send", return_value=response) as send:
+            _logout_session(*minthcm._logout_args())
+
+        request = send.call_args.args[0]
+        self.assertEqual(request.body, b'{"data":null}')
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(request.headers["Authorization"], "Bearer t1")
+        self.assertEqual(_BODY_HEADERS, {"Content-Type": "application/json"})
+
+
+if __name__ == "__main__":
+    unittest.main()